@@ -115,8 +115,8 @@ def final_analysis(csv_path="results/final_parity_check_results_dm1.csv"):
 
     print("\nRunning one instance locally to compare fidelity metrics...")
     device = LocalSimulator("braket_dm")
-    base_c = create_random_er_circuit(seed=1337)
-    noisy_c = apply_noise_to_circuit(base_c)
+    base_c, _ = create_random_er_circuit(seed=1337)
+    noisy_c, _ = apply_noise_to_circuit(base_c)
     base_c.density_matrix()
     noisy_c.density_matrix()
 
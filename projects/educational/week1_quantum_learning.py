@@ -7,10 +7,10 @@ Goal: Build understanding through hands-on experimentation
 """
 
 import json
+import os
 from datetime import datetime
 from typing import Dict
 
-import matplotlib.pyplot as plt
 import numpy as np
 from braket.circuits import Circuit
 from braket.devices import LocalSimulator
@@ -241,7 +241,19 @@ class QuantumLearningLab:
         return results
 
     def plot_noise_study(self, results: Dict):
-        """Create plots to visualize noise sensitivity"""
+        """Create plots to visualize noise sensitivity
+        Set SHOW_PLOTS=1 to open the figure window; otherwise the plot is
+        only saved, using the non-interactive Agg backend
+        """
+        # Import lazily so batch runs don't pay matplotlib's start-up cost
+        import matplotlib
+
+        flag = os.environ.get("SHOW_PLOTS", "").strip().lower()
+        show = flag not in ("", "0", "false", "no", "off")
+        if not show:
+            matplotlib.use("Agg")  # Use non-interactive backend
+        import matplotlib.pyplot as plt
+
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
 
         # Plot 1: Entropy vs Noise
@@ -281,7 +293,9 @@ class QuantumLearningLab:
 
         plt.tight_layout()
         plt.savefig("noise_sensitivity_study.png", dpi=150, bbox_inches="tight")
-        plt.show()
+        if show:
+            plt.show()
+        plt.close(fig)
 
         print("\n📈 Plots saved as 'noise_sensitivity_study.png'")
 
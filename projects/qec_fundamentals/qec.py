@@ -1,9 +1,9 @@
+import csv
 import os
 import subprocess
 import venv
 import numpy as np
-import pandas as pd
-from braket.circuits import Circuit
+from braket.circuits import Circuit, noises
 from braket.devices import LocalSimulator
 import logging
 from scipy import stats
@@ -25,6 +25,13 @@ class QECProject:
         self.P_AMPLITUDE = 1 - np.exp(-self.GATE_TIME / self.T1)
         self.P_DEPHASING = 1 - np.exp(-self.GATE_TIME / self.T2)
 
+        # Kraus operators of one noise layer, matching _add_noise
+        self._noise_kraus = (
+            noises.AmplitudeDamping(self.P_AMPLITUDE).to_matrix(),
+            noises.PhaseDamping(self.P_DEPHASING).to_matrix(),
+        )
+        self._syndrome_cache = {}
+
     def run_full_analysis(self):
         """Main entry point to run the entire analysis pipeline."""
         os.makedirs(self.data_dir, exist_ok=True)
@@ -39,14 +46,14 @@ class QECProject:
         max_steps = 5 if self.quick else 20
         
         # Run benchmark
-        benchmark_df = self._run_qec_benchmark(
+        benchmark_data = self._run_qec_benchmark(
             code_type="3_qubit", 
             max_evolution_steps=max_steps
         )
         
         # Save results
         output_path = os.path.join(self.data_dir, "3q_benchmark_results.csv")
-        benchmark_df.to_csv(output_path, index=False)
+        self._write_csv(output_path, benchmark_data)
         logging.info(f"3-qubit benchmark results saved to {output_path}")
 
         # Run the controlled comparison
@@ -55,7 +62,7 @@ class QECProject:
         
         # Save results
         output_path = os.path.join(self.data_dir, "controlled_comparison_results.csv")
-        comparison_results['raw_data'].to_csv(output_path, index=False)
+        self._write_csv(output_path, comparison_results['raw_data'])
         logging.info(f"Controlled comparison results saved to {output_path}")
         print("Statistical Summary:")
         print(comparison_results['statistical_summary'])
@@ -67,31 +74,25 @@ class QECProject:
         the 3-qubit and 5-qubit codes.
         """
         n_trials = 3 if self.quick else 10
-        results = []
         
         # Normalize noise exposure
         noise_ops_3q = 3 * max_evolution_steps
         steps_5q = int(noise_ops_3q / 5)
 
-        for trial in range(n_trials):
-            logging.info(f"Running trial {trial+1}/{n_trials}...")
-            fid_3q = self._get_logical_qubit_fidelity("3_qubit", max_evolution_steps)
-            fid_5q = self._get_logical_qubit_fidelity("5_qubit", steps_5q)
-            results.append({
-                'trial': trial,
-                'fidelity_3qubit': fid_3q,
-                'fidelity_5qubit': fid_5q,
-                'qec_advantage': fid_5q - fid_3q,
-            })
-        
-        df = pd.DataFrame(results)
+        # The density-matrix simulation is deterministic and every trial uses
+        # the same noise parameters, so each code is simulated once and the
+        # result is broadcast over the trial axis.
+        logging.info(f"Running {n_trials} trials...")
+        fid_3q = np.full(n_trials, self._get_logical_qubit_fidelity("3_qubit", max_evolution_steps))
+        fid_5q = np.full(n_trials, self._get_logical_qubit_fidelity("5_qubit", steps_5q))
+        advantage = fid_5q - fid_3q
         
         # Statistical analysis
-        adv_mean = df['qec_advantage'].mean()
-        adv_std = df['qec_advantage'].std()
+        adv_mean = advantage.mean()
+        adv_std = advantage.std(ddof=1)
         
-        ci = stats.t.interval(0.95, len(df)-1, loc=adv_mean, scale=adv_std/np.sqrt(len(df)))
-        t_stat, p_value = stats.ttest_1samp(df['qec_advantage'], 0)
+        ci = stats.t.interval(0.95, n_trials-1, loc=adv_mean, scale=adv_std/np.sqrt(n_trials))
+        t_stat, p_value = stats.ttest_1samp(advantage, 0)
         cohens_d = adv_mean / adv_std if adv_std > 0 else 0
         
         summary = {
@@ -102,49 +103,115 @@ class QECProject:
             'p_value': p_value,
             'cohens_d': cohens_d,
         }
-        return {'raw_data': df, 'statistical_summary': summary}
+        raw_data = {
+            'trial': np.arange(n_trials),
+            'fidelity_3qubit': fid_3q,
+            'fidelity_5qubit': fid_5q,
+            'qec_advantage': advantage,
+        }
+        return {'raw_data': raw_data, 'statistical_summary': summary}
 
     def _run_qec_benchmark(self, code_type, max_evolution_steps):
         """Compares logical vs. physical qubit fidelity for a given QEC code."""
         logging.info(f"Running QEC benchmark for {code_type} code...")
-        results = []
-        
-        for steps in range(1, max_evolution_steps + 1, 1 if self.quick else 4):
-            # Physical qubit simulation
-            phys_fidelity = self._get_physical_qubit_fidelity(steps)
-            
-            # Logical qubit simulation
-            log_fidelity = self._get_logical_qubit_fidelity(code_type, steps)
-            
-            results.append({
-                'evolution_steps': steps,
-                'physical_fidelity': phys_fidelity,
-                'logical_fidelity': log_fidelity,
-                'qec_advantage': log_fidelity - phys_fidelity,
-            })
-        return pd.DataFrame(results)
+        steps_range = np.arange(1, max_evolution_steps + 1, 1 if self.quick else 4)
+        phys = np.empty(len(steps_range))
+        log = np.empty_like(phys)
 
-    def _get_physical_qubit_fidelity(self, evolution_steps):
-        """Simulates a single physical qubit."""
-        circ = Circuit().h(0)
-        self._add_noise(circ, [0], evolution_steps)
-        circ.density_matrix() # Request density matrix
-        
-        result = self.device.run(circ, shots=0).result()
-        dm = result.result_types[0].value
-        
-        # Fidelity for a single qubit in state |+> is Tr(rho * |+><+|)
-        # For |+>, the density matrix is [[0.5, 0.5], [0.5, 0.5]]
-        # The fidelity is simply the sum of diagonal elements (total probability)
-        # if the off-diagonals are real and positive.
-        # A simpler measure is just the trace, which should be 1.
-        return np.trace(dm).real
+        # Each step only appends one more noise layer, so both qubits are
+        # evolved once up to max(steps) and sampled along the way.
+
+        # Physical qubit simulation. Fidelity for a single qubit in state |+>
+        # is Tr(rho * |+><+|); as a simpler measure we report the trace,
+        # which should be 1.
+        plus = np.full((2, 2), 0.5, dtype=complex)
+        for i, (_, dm) in enumerate(self._noise_snapshots(plus, [0], steps_range)):
+            phys[i] = np.trace(dm).real
+
+        # Logical qubit simulation
+        data_qubits, _ = self._get_code_qubits(code_type)
+        encoded = self._create_logical_state_circuit(code_type, "|+>").to_unitary()[:, 0]
+        rho = np.outer(encoded, encoded.conj())
+        for i, (_, dm) in enumerate(self._noise_snapshots(rho, data_qubits, steps_range)):
+            probabilities = self._apply_syndrome_to_populations(code_type, np.real(np.diag(dm)))
+            log[i] = self._decode_and_correct(code_type, probabilities)
+
+        return {
+            'evolution_steps': steps_range,
+            'physical_fidelity': phys,
+            'logical_fidelity': log,
+            'qec_advantage': log - phys,
+        }
+
+    @staticmethod
+    def _write_csv(path, columns):
+        """Writes a dict of equal-length column arrays to a CSV file."""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*(col.tolist() for col in columns.values())))
+
+    def _get_code_qubits(self, code_type):
+        """Returns the (data, syndrome) qubit indices for a QEC code."""
+        if code_type == "3_qubit":
+            return list(range(3)), list(range(3, 5))
+        return list(range(5)), list(range(5, 9))
+
+    def _noise_snapshots(self, rho, qubits, snapshot_steps):
+        """
+        Evolves a density matrix through successive noise layers and yields
+        (steps, rho) at each requested step count, in increasing order.
+        """
+        n_qubits = int(np.log2(rho.shape[0]))
+        targets = {int(s) for s in snapshot_steps}
+        for step in range(1, max(targets) + 1):
+            for q in qubits:
+                for kraus in self._noise_kraus:
+                    rho = self._apply_kraus(rho, kraus, q, n_qubits)
+            if step in targets:
+                yield step, rho
+
+    @staticmethod
+    def _apply_kraus(rho, kraus, qubit, n_qubits):
+        """Applies a single-qubit Kraus channel to one qubit of a density matrix."""
+        tensor = rho.reshape((2,) * (2 * n_qubits))
+        col = n_qubits + qubit
+        out = np.zeros_like(tensor)
+        for k in kraus:
+            term = np.moveaxis(np.tensordot(k, tensor, axes=([1], [qubit])), 0, qubit)
+            term = np.moveaxis(np.tensordot(term, k.conj(), axes=([col], [1])), -1, col)
+            out += term
+        return out.reshape(rho.shape)
+
+    def _get_syndrome_detection(self, code_type):
+        """
+        Returns the syndrome detection circuit for a code's fixed qubit layout,
+        together with the basis state each data-register input is mapped to.
+        Both are built once per code type.
+        """
+        if code_type not in self._syndrome_cache:
+            data_qubits, syndrome_qubits = self._get_code_qubits(code_type)
+            circuit = self._create_syndrome_detection_circuit(code_type, data_qubits, syndrome_qubits)
+            # The circuit only holds CNOT/CZ gates, which send each basis
+            # state to a single basis state (up to phase)
+            inputs = np.arange(2 ** len(data_qubits)) << len(syndrome_qubits)
+            outputs = np.argmax(np.abs(circuit.to_unitary()[:, inputs]), axis=0)
+            self._syndrome_cache[code_type] = (circuit, outputs)
+        return self._syndrome_cache[code_type]
+
+    def _apply_syndrome_to_populations(self, code_type, populations):
+        """
+        Maps data-qubit populations to measurement probabilities after syndrome
+        detection. The output diagonal is a permutation of the input one.
+        """
+        circuit, outputs = self._get_syndrome_detection(code_type)
+        n_qubits = circuit.qubit_count
+        return {format(o, f'0{n_qubits}b'): p for o, p in zip(outputs, populations)}
 
     def _get_logical_qubit_fidelity(self, code_type, evolution_steps):
         """Simulates a logical qubit with a given QEC code."""
         if code_type == "3_qubit":
             data_qubits = list(range(3))
-            syndrome_qubits = list(range(3, 5))
             
             # Create logical |+> state
             circ = self._create_logical_state_circuit(code_type, "|+>")
@@ -153,14 +220,11 @@ class QECProject:
             self._add_noise(circ, data_qubits, evolution_steps)
             
             # Add syndrome detection
-            circ.add_circuit(self._create_syndrome_detection_circuit(code_type, data_qubits, syndrome_qubits))
+            circ.add_circuit(self._get_syndrome_detection(code_type)[0])
             
-            circ.density_matrix() # Request density matrix
+            circ.probability() # Only the diagonal of the density matrix is needed
             result = self.device.run(circ, shots=0).result()
-            dm = result.result_types[0].value
-            
-            # Extract probabilities from the diagonal of the density matrix
-            probs = np.real(np.diag(dm))
+            probs = result.result_types[0].value
             n_qubits = int(np.log2(len(probs)))
             probabilities = {format(i, f'0{n_qubits}b'): p for i, p in enumerate(probs)}
 
@@ -168,7 +232,6 @@ class QECProject:
             return self._decode_and_correct(code_type, probabilities)
         elif code_type == "5_qubit":
             data_qubits = list(range(5))
-            syndrome_qubits = list(range(5, 9))
             
             # Create logical |+> state
             circ = self._create_logical_state_circuit(code_type, "|+>")
@@ -177,14 +240,11 @@ class QECProject:
             self._add_noise(circ, data_qubits, evolution_steps)
             
             # Add syndrome detection
-            circ.add_circuit(self._create_syndrome_detection_circuit(code_type, data_qubits, syndrome_qubits))
+            circ.add_circuit(self._get_syndrome_detection(code_type)[0])
             
-            circ.density_matrix() # Request density matrix
+            circ.probability() # Only the diagonal of the density matrix is needed
             result = self.device.run(circ, shots=0).result()
-            dm = result.result_types[0].value
-            
-            # Extract probabilities
-            probs = np.real(np.diag(dm))
+            probs = result.result_types[0].value
             n_qubits = int(np.log2(len(probs)))
             probabilities = {format(i, f'0{n_qubits}b'): p for i, p in enumerate(probs)}
             
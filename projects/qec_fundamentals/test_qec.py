@@ -1,6 +1,8 @@
 import os
 import unittest
+import numpy as np
 import pandas as pd
+from braket.circuits import noises
 from qec import QECProject
 
 class TestQECProject(unittest.TestCase):
@@ -44,5 +46,44 @@ class TestQECProject(unittest.TestCase):
             if os.path.exists(f):
                 os.remove(f)
 
+class TestNoiseEvolution(unittest.TestCase):
+    """The in-process Kraus evolution must match the braket_dm simulator."""
+
+    NOISE_LEVELS = [(None, None), (0.05, 0.1)]
+    STEPS = [1, 3]
+
+    def setUp(self):
+        self.project = QECProject(quick=True)
+
+    def _set_noise(self, p_amplitude, p_dephasing):
+        """Overrides the damping probabilities; None keeps the default."""
+        if p_amplitude is not None:
+            self.project.P_AMPLITUDE = p_amplitude
+            self.project.P_DEPHASING = p_dephasing
+            self.project._noise_kraus = (
+                noises.AmplitudeDamping(p_amplitude).to_matrix(),
+                noises.PhaseDamping(p_dephasing).to_matrix(),
+            )
+
+    def test_kraus_evolution_matches_braket_dm(self):
+        """_noise_snapshots agrees with the same noise run on braket_dm."""
+        for code_type in ["3_qubit", "5_qubit"]:
+            for p_amplitude, p_dephasing in self.NOISE_LEVELS:
+                with self.subTest(code=code_type, p_amplitude=p_amplitude):
+                    self._set_noise(p_amplitude, p_dephasing)
+                    data_qubits, _ = self.project._get_code_qubits(code_type)
+                    encode = self.project._create_logical_state_circuit(code_type, "|+>")
+                    state = encode.to_unitary()[:, 0]
+                    rho = np.outer(state, state.conj())
+
+                    snapshots = self.project._noise_snapshots(rho, data_qubits, self.STEPS)
+                    for steps, dm in snapshots:
+                        circ = self.project._create_logical_state_circuit(code_type, "|+>")
+                        self.project._add_noise(circ, data_qubits, steps)
+                        circ.density_matrix()
+                        result = self.project.device.run(circ, shots=0).result()
+                        expected = np.asarray(result.values[0])
+                        np.testing.assert_allclose(dm, expected, atol=1e-10)
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
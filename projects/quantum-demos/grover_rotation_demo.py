@@ -1,5 +1,14 @@
+import functools
 import math
 
+import numpy as np
+
+
+@functools.lru_cache(maxsize=None)
+def grover_iters(N):
+    """Optimal number of Grover iterations for a database of N items."""
+    return int(round(math.pi / 4 * math.sqrt(N)))
+
 
 def grover_rotation_explanation():
     print("=== Grover's Algorithm: The Real Magic ===\n")
@@ -13,10 +22,10 @@ def grover_rotation_explanation():
 
     print(f"Database: {N} items")
     print(f"Looking for: Item #{target_item}")
-    print(f"Optimal iterations: {math.pi * math.sqrt(N) / 4:.0f}\n")
+    print(f"Optimal iterations: {grover_iters(N)}\n")
 
     # Initial state: all items equally likely
-    amplitudes = [0.5, 0.5, 0.5, 0.5]  # All start with equal amplitude
+    amplitudes = np.full(N, 1 / math.sqrt(N))  # All start with equal amplitude
 
     print("Iteration | Item 0 | Item 1 | Item 2* | Item 3 | Target Probability")
     print("-" * 65)
@@ -25,13 +34,12 @@ def grover_rotation_explanation():
     )
 
     # Grover iterations
-    for iteration in range(1, 4):
+    for iteration in range(1, grover_iters(N) + 1):
         # Oracle: flip the sign of target item
         amplitudes[target_item] *= -1
 
         # Diffusion: reflect around average
-        avg = sum(amplitudes) / len(amplitudes)
-        amplitudes = [2 * avg - amp for amp in amplitudes]
+        amplitudes = 2 * amplitudes.mean() - amplitudes
 
         probability = amplitudes[target_item] ** 2
         print(
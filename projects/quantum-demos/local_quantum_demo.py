@@ -11,6 +11,9 @@ import time
 from braket.circuits import Circuit
 from braket.devices import LocalSimulator
 
+# (size in bytes, label), largest first
+_UNITS = [(1024**4, "TB"), (1024**3, "GB"), (1024**2, "MB"), (1024, "KB"), (1, "bytes")]
+
 
 def demonstrate_local_simulation():
     """Show what LocalSimulator actually does"""
@@ -93,16 +96,8 @@ def scaling_demonstration():
         # Each complex number needs 16 bytes (8 for real, 8 for imaginary)
         memory_bytes = states * 16
 
-        if memory_bytes < 1024:
-            memory_str = f"{memory_bytes} bytes"
-        elif memory_bytes < 1024**2:
-            memory_str = f"{memory_bytes/1024:.1f} KB"
-        elif memory_bytes < 1024**3:
-            memory_str = f"{memory_bytes/(1024**2):.1f} MB"
-        elif memory_bytes < 1024**4:
-            memory_str = f"{memory_bytes/(1024**3):.1f} GB"
-        else:
-            memory_str = f"{memory_bytes/(1024**4):.1f} TB"
+        unit, name = next((u, n) for u, n in _UNITS if memory_bytes >= u)
+        memory_str = f"{memory_bytes/unit:.1f} {name}"
 
         print(f"{qubits:2d} qubits: {states:>15,} quantum states → {memory_str}")
 
@@ -25,6 +25,50 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from .original_maxcut import OriginalMaxCut
 
+# Optional JIT compilation of the enumeration kernel (install: pip install numba)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _all_cuts_loop(shift_u: np.ndarray, shift_v: np.ndarray,
+                   weights: np.ndarray, num_nodes: int) -> np.ndarray:
+    """
+    Cut value of every partition, indexed by the integer value of its
+    bitstring. shift_u/shift_v give each edge endpoint's bit position
+    counted from the least significant bit.
+    """
+    cuts = np.zeros(1 << num_nodes)
+    for s in range(1 << num_nodes):
+        cut_weight = 0.0
+        for k in range(weights.shape[0]):
+            if ((s >> shift_u[k]) ^ (s >> shift_v[k])) & 1:
+                cut_weight += weights[k]
+        cuts[s] = cut_weight
+    return cuts
+
+
+def _all_cuts_vectorized(shift_u: np.ndarray, shift_v: np.ndarray,
+                         weights: np.ndarray, num_nodes: int) -> np.ndarray:
+    """
+    NumPy equivalent of _all_cuts_loop: each edge adds its weight to all
+    2^n partitions at once, using the XOR of its endpoint bits as the cut
+    indicator.
+    """
+    idx = np.arange(1 << num_nodes, dtype=np.uint64)
+    cuts = np.zeros(1 << num_nodes)
+    for su, sv, w in zip(shift_u.astype(np.uint64), shift_v.astype(np.uint64), weights):
+        cuts += w * (((idx >> su) ^ (idx >> sv)) & 1)
+    return cuts
+
+
+if NUMBA_AVAILABLE:
+    _all_cuts = njit(cache=True)(_all_cuts_loop)
+else:
+    _all_cuts = _all_cuts_vectorized
+
 
 class CanonicalMaxCut:
     """
@@ -33,6 +77,8 @@ class CanonicalMaxCut:
     MaxCut problem.
     """
 
+    __slots__ = ('graph', 'num_nodes', '_edge_u', '_edge_v', '_edge_w', '_cut_cache')
+
     def __init__(self, graph: nx.Graph = None):
         """
         Initialize the CanonicalMaxCut calculator.
@@ -50,6 +96,18 @@ class CanonicalMaxCut:
 
         self.num_nodes = self.graph.number_of_nodes()
 
+        # Edge endpoints and weights as arrays, extracted once so the hot
+        # paths never walk the networkx adjacency dicts
+        edges = np.array(self.graph.edges(), dtype=np.int64).reshape(-1, 2)
+        self._edge_u = edges[:, 0]
+        self._edge_v = edges[:, 1]
+        self._edge_w = np.fromiter(
+            (data.get('weight', 1.0) for _, _, data in self.graph.edges(data=True)),
+            dtype=np.float64, count=len(edges),
+        )
+        # Full cut table, filled on first use by calculate_qaoa_expectation
+        self._cut_cache = None
+
     def calculate_cut_value(self, bitstring: str) -> float:
         """
         Calculate cut value for a given bitstring by summing the weights
@@ -65,31 +123,52 @@ class CanonicalMaxCut:
             raise ValueError(f"Bitstring length {len(bitstring)} doesn't match "
                            f"graph size {self.num_nodes}")
 
-        cut_weight = 0.0
-        for u, v, data in self.graph.edges(data=True):
-            if bitstring[u] != bitstring[v]:
-                cut_weight += data.get('weight', 1.0)
+        bits = np.frombuffer(bitstring.encode(), dtype=np.uint8)
+        crossing = bits[self._edge_u] != bits[self._edge_v]
+        return float(self._edge_w @ crossing)
+
+    def _edge_shifts(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bit positions of each edge's endpoints within the integer value of
+        a bitstring (node u is character u, i.e. bit num_nodes-1-u).
+        """
+        return self.num_nodes - 1 - self._edge_u, self.num_nodes - 1 - self._edge_v
+
+    def cut_value_int(self, partition: int) -> float:
+        """
+        Calculate the cut value for the partition whose bitstring is the
+        binary form of the given integer.
+        """
+        shift_u, shift_v = self._edge_shifts()
+        crossing = ((partition >> shift_u) ^ (partition >> shift_v)) & 1
+        return float(self._edge_w @ crossing)
 
-        return float(cut_weight)
+    def get_all_cut_values_array(self) -> np.ndarray:
+        """
+        Calculate all cut values, indexed by the integer value of each
+        bitstring. Avoids building 2^n bitstring keys.
+        """
+        shift_u, shift_v = self._edge_shifts()
+        return _all_cuts(shift_u, shift_v, self._edge_w, self.num_nodes)
 
     def get_all_cut_values(self) -> Dict[str, float]:
         """
         Calculate all cut values for every possible bitstring.
         """
-        cut_values = {}
-        for i in range(2 ** self.num_nodes):
-            bitstring = format(i, f'0{self.num_nodes}b')
-            cut_value = self.calculate_cut_value(bitstring)
-            cut_values[bitstring] = cut_value
-        return cut_values
+        cuts = self.get_all_cut_values_array()
+        return {
+            format(i, f'0{self.num_nodes}b'): float(cut_value)
+            for i, cut_value in enumerate(cuts)
+        }
 
     def get_optimal_cut(self) -> Tuple[str, float]:
         """
         Find the optimal cut by maximizing the total cut weight.
         """
-        all_cuts = self.get_all_cut_values()
-        optimal_bitstring = max(all_cuts, key=all_cuts.get)
-        optimal_value = all_cuts[optimal_bitstring]
+        all_cuts = self.get_all_cut_values_array()
+        optimal_index = int(np.argmax(all_cuts))
+        optimal_bitstring = format(optimal_index, f'0{self.num_nodes}b')
+        optimal_value = float(all_cuts[optimal_index])
         return optimal_bitstring, optimal_value
 
     def calculate_qaoa_expectation(self, bitstring_probabilities: Dict[str, float]) -> float:
@@ -103,11 +182,17 @@ class CanonicalMaxCut:
         Returns:
             The expected cut value.
         """
-        expectation = 0.0
+        if self._cut_cache is None:
+            self._cut_cache = self.get_all_cut_values_array()
+
+        # Scatter the distribution into a dense vector over all partitions
+        probabilities = np.zeros(1 << self.num_nodes)
         for bitstring, probability in bitstring_probabilities.items():
-            cut_value = self.calculate_cut_value(bitstring)
-            expectation += probability * cut_value
-        return expectation
+            if len(bitstring) != self.num_nodes:
+                raise ValueError(f"Bitstring length {len(bitstring)} doesn't match "
+                               f"graph size {self.num_nodes}")
+            probabilities[int(bitstring, 2)] += probability
+        return float(probabilities @ self._cut_cache)
 
     def get_method_info(self) -> Dict:
         """
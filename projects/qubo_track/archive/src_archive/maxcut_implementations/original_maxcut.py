@@ -120,6 +120,17 @@ class OriginalMaxCut:
         """
         return self.lookup_table.copy()
     
+    def get_all_cut_values_array(self) -> np.ndarray:
+        """
+        Get all cut values as an array indexed by the integer value of
+        each bitstring (the lookup table's insertion order).
+        
+        Returns:
+            Array of cut values
+        """
+        return np.fromiter(self.lookup_table.values(), dtype=np.float64,
+                           count=len(self.lookup_table))
+    
     def get_optimal_cut(self) -> Tuple[str, float]:
         """
         Find the optimal cut using the original method.
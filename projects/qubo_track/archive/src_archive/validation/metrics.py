@@ -2,9 +2,18 @@
 Quantum Information Theory Metrics
 """
 import numpy as np
-from scipy.linalg import sqrtm
 
-def fidelity(rho: np.ndarray, sigma: np.ndarray) -> float:
+def _psd_sqrt(A: np.ndarray) -> np.ndarray:
+    """
+    Square root of a Hermitian positive semi-definite matrix via its
+    eigendecomposition. Eigenvalues are clipped at zero to absorb small
+    negative values from numerical noise.
+    """
+    w, V = np.linalg.eigh(A)
+    w = np.clip(w, 0, None)
+    return (V * np.sqrt(w)) @ V.conj().T
+
+def fidelity(rho: np.ndarray, sigma: np.ndarray, validate: bool = True) -> float:
     """
     Calculates the Uhlmann-Jozsa fidelity between two density matrices.
 
@@ -13,25 +22,30 @@ def fidelity(rho: np.ndarray, sigma: np.ndarray) -> float:
     Args:
         rho: A density matrix (Hermitian, trace-1).
         sigma: A density matrix (Hermitian, trace-1).
+        validate: If True (the default), check that both inputs have unit
+            trace and are Hermitian before computing. Loops over trusted
+            inputs may pass False to skip the O(n^2) checks.
 
     Returns:
         The fidelity between rho and sigma.
     """
-    # Validate inputs
-    if not np.allclose(np.trace(rho), 1.0) or not np.allclose(np.trace(sigma), 1.0):
-        raise ValueError("Density matrices must have a trace of 1.")
-    if not np.allclose(rho, rho.conj().T) or not np.allclose(sigma, sigma.conj().T):
-        raise ValueError("Density matrices must be Hermitian.")
+    if validate:
+        if not np.allclose(np.trace(rho), 1.0) or not np.allclose(np.trace(sigma), 1.0):
+            raise ValueError("Density matrices must have a trace of 1.")
+        if not np.allclose(rho, rho.conj().T) or not np.allclose(sigma, sigma.conj().T):
+            raise ValueError("Density matrices must be Hermitian.")
 
     # Calculate fidelity
-    sqrt_rho = sqrtm(rho)
+    # Both matrices are Hermitian PSD, so the symmetric eigensolver applies
+    sqrt_rho = _psd_sqrt(rho)
     # The @ operator is equivalent to np.matmul
-    inner_matrix = sqrtm(sqrt_rho @ sigma @ sqrt_rho)
+    inner = sqrt_rho @ sigma @ sqrt_rho
     
-    # Fidelity is the squared trace of the resulting matrix.
-    # The result should be real, but we take np.real to discard tiny imaginary
-    # parts from numerical precision errors.
-    fid = float(np.real(np.trace(inner_matrix))**2)
+    # Fidelity is the squared trace of sqrt(inner). That trace is the sum of
+    # the square roots of inner's eigenvalues, so the matrix square root
+    # itself is never built. eigvalsh returns real eigenvalues directly.
+    eigenvalues = np.clip(np.linalg.eigvalsh(inner), 0, None)
+    fid = float(np.sum(np.sqrt(eigenvalues))**2)
     
     return fid 
 
@@ -62,18 +76,31 @@ def dm1_to_numpy(raw: list) -> np.ndarray:
         mat = raw
     else:
         dim = len(raw)
-        mat = np.empty((dim, dim), dtype=np.complex128)
-        for i, row in enumerate(raw):
-            for j, elem in enumerate(row):
-                if isinstance(elem, dict):
-                    # Handles {'real': ..., 'imag': ...} format
-                    mat[i, j] = elem.get("real", 0.0) + 1j * elem.get("imag", 0.0)
-                elif isinstance(elem, (list, tuple)) and len(elem) == 2:
-                    # Handles [real, imag] or (real, imag) format
-                    mat[i, j] = complex(elem[0], elem[1])
-                else:
-                    # Handles raw numeric types (e.g., float, complex)
-                    mat[i, j] = complex(elem)
+        try:
+            arr = np.asarray(raw)
+        except ValueError:  # ragged, e.g. [real, imag] pairs mixed with scalars
+            arr = None
+        if arr is not None and arr.dtype != object and arr.shape == (dim, dim, 2):
+            # Handles [real, imag] or (real, imag) format
+            mat = arr.astype(np.float64).view(np.complex128).reshape(dim, dim)
+        elif arr is not None and arr.dtype != object and arr.shape == (dim, dim):
+            # Handles raw numeric types (e.g., float, complex)
+            mat = arr.astype(np.complex128)
+        elif all(isinstance(e, dict) for row in raw for e in row):
+            # Handles {'real': ..., 'imag': ...} format
+            flat = [(e.get("real", 0.0), e.get("imag", 0.0)) for row in raw for e in row]
+            mat = np.array(flat, dtype=np.float64).view(np.complex128).reshape(dim, dim)
+        else:
+            # Mixed element formats: convert cell by cell
+            mat = np.empty((dim, dim), dtype=np.complex128)
+            for i, row in enumerate(raw):
+                for j, elem in enumerate(row):
+                    if isinstance(elem, dict):
+                        mat[i, j] = elem.get("real", 0.0) + 1j * elem.get("imag", 0.0)
+                    elif isinstance(elem, (list, tuple)) and len(elem) == 2:
+                        mat[i, j] = complex(elem[0], elem[1])
+                    else:
+                        mat[i, j] = complex(elem)
 
     # Squeeze to handle potential (d,d,1) shapes
     return np.squeeze(mat) 
\ No newline at end of file
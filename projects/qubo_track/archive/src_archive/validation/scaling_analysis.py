@@ -24,63 +24,72 @@ def run_scaling_analysis(graph_sizes: list):
         graph_sizes: A list of integers specifying the number of nodes
                      for the graphs to be tested.
     """
-    print("=" * 70)
-    print("      Starting MaxCut Implementation Scaling Analysis")
-    print("=" * 70)
-    print(f"Testing graph sizes: {graph_sizes}\n")
+    # Report lines are buffered and written in one go at the end, keeping
+    # per-line stdout flushes out of the enumeration loop
+    report = []
+    out = report.append
+
+    out("=" * 70)
+    out("      Starting MaxCut Implementation Scaling Analysis")
+    out("=" * 70)
+    out(f"Testing graph sizes: {graph_sizes}\n")
 
     all_tests_passed = True
 
     for size in graph_sizes:
-        print(f"--- Testing Graph Size: {size} nodes ---")
+        out(f"--- Testing Graph Size: {size} nodes ---")
         start_time = time.time()
 
         # Generate a random unweighted graph of the given size
         graph = nx.erdos_renyi_graph(n=size, p=0.7, seed=42)
 
-        print(f"Generated a random graph with {graph.number_of_edges()} edges.")
+        out(f"Generated a random graph with {graph.number_of_edges()} edges.")
 
         # Instantiate both implementations
         try:
             canonical_impl = CanonicalMaxCut(graph=graph)
             original_impl = OriginalMaxCut(graph=graph)
             
-            canonical_cuts = canonical_impl.get_all_cut_values()
-            original_cuts = original_impl.get_all_cut_values()
-
-            discrepancy_found = False
-            for bitstring in canonical_cuts:
-                canonical_val = canonical_cuts[bitstring]
-                original_val = original_cuts[bitstring]
-
-                if canonical_val != 0:
-                    if not np.isclose(original_val, canonical_val * 0.5):
-                        print(f"❌ FAIL: Discrepancy relationship does not hold for size {size}.")
-                        print(f"   Bitstring: {bitstring}, Canonical: {canonical_val}, Original: {original_val}")
-                        discrepancy_found = True
-                        all_tests_passed = False
-                        break
+            # Cut values indexed by the integer value of each bitstring
+            canonical_cuts = canonical_impl.get_all_cut_values_array()
+            original_cuts = original_impl.get_all_cut_values_array()
+
+            # Compare every non-zero canonical cut in one vectorized pass
+            nonzero = np.flatnonzero(canonical_cuts)
+            bad = ~np.isclose(original_cuts[nonzero], canonical_cuts[nonzero] * 0.5)
+
+            # argmax returns the first failing index (or 0 when none fail)
+            first_bad = np.argmax(bad) if bad.size else 0
+            discrepancy_found = bool(bad.size) and bool(bad[first_bad])
+            if discrepancy_found:
+                first = nonzero[first_bad]
+                bitstring = format(first, f'0{size}b')
+                out(f"❌ FAIL: Discrepancy relationship does not hold for size {size}.")
+                out(f"   Bitstring: {bitstring}, Canonical: {canonical_cuts[first]}, Original: {original_cuts[first]}")
+                all_tests_passed = False
             
             end_time = time.time()
             duration = end_time - start_time
 
             if not discrepancy_found:
-                print(f"✅ PASS: Discrepancy relationship (original = canonical * 0.5) holds.")
-                print(f"   (Validated on {2**size} bitstrings in {duration:.2f} seconds)")
+                out(f"✅ PASS: Discrepancy relationship (original = canonical * 0.5) holds.")
+                out(f"   (Validated on {2**size} bitstrings in {duration:.2f} seconds)")
 
         except Exception as e:
-            print(f"❌ ERROR: An exception occurred during validation for graph size {size}.")
-            print(f"   Error: {e}")
+            out(f"❌ ERROR: An exception occurred during validation for graph size {size}.")
+            out(f"   Error: {e}")
             all_tests_passed = False
 
-        print("-" * 35 + "\n")
+        out("-" * 35 + "\n")
 
-    print("=" * 70)
+    out("=" * 70)
     if all_tests_passed:
-        print("🎉 Scaling Analysis Complete: Discrepancy is consistent across all tested sizes.")
+        out("🎉 Scaling Analysis Complete: Discrepancy is consistent across all tested sizes.")
     else:
-        print("🔥 Scaling Analysis Complete: One or more validations failed.")
-    print("=" * 70)
+        out("🔥 Scaling Analysis Complete: One or more validations failed.")
+    out("=" * 70)
+
+    print("\n".join(report), flush=True)
 
 if __name__ == "__main__":
     GRAPH_SIZES_TO_TEST = [4, 6, 8, 10, 12]
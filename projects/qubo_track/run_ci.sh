@@ -40,6 +40,11 @@ python tests/test_comprehensive.py
 echo "✅ Comprehensive tests passed"
 echo
 
+echo "5b. Running exact kernel tests..."
+python tests/test_exact_kernels.py
+echo "✅ Exact kernel tests passed"
+echo
+
 # Step 5: Security audit
 echo "6. Running security audit..."
 safety check --json || echo "⚠️ Security check completed (warnings may exist)"
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Exact Max-Cut Kernels
+
+The K_n / path / cycle tests are answered by max_cut_closed_form, so these
+tests use seeded random graphs with no closed form to exercise the Gray-code
+enumeration (n <= EXACT_BNB_MIN_NODES) and the branch-and-bound (above it),
+with numba and with the pure NumPy/Python fallbacks.
+"""
+
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+import networkx as nx
+import numpy as np
+
+import corrected_classical_optimization as cco
+
+def brute_force_max_cut(graph):
+    """Reference optimum: score every assignment of the first n-1 nodes"""
+    n = graph.number_of_nodes()
+    edges = np.array([(u, v) for u, v in graph.edges() if u != v], dtype=np.int64)
+    if n < 2 or len(edges) == 0:
+        return 0
+    best = 0
+    total = 1 << (n - 1)
+    for start in range(0, total, 1 << 14):
+        m = np.arange(start, min(start + (1 << 14), total), dtype=np.int64)[:, None]
+        cut = ((m >> edges[:, 0]) ^ (m >> edges[:, 1])) & 1
+        best = max(best, int(cut.sum(axis=1).max()))
+    return best
+
+def random_graph(n, seed, weighted=False):
+    """Seeded G(n, 0.5) graph that no closed form covers"""
+    graph = nx.gnp_random_graph(n, 0.5, seed=seed)
+    while cco.max_cut_closed_form(graph) is not None:
+        seed += 1000
+        graph = nx.gnp_random_graph(n, 0.5, seed=seed)
+    if weighted:
+        rng = np.random.default_rng(seed)
+        for u, v in graph.edges():
+            graph[u][v]['weight'] = float(rng.uniform(0.5, 2.0))
+    return graph
+
+def exact_max_cut(graph):
+    """compute_exact_max_cut with its progress output silenced"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return cco.compute_exact_max_cut(graph)
+
+class ExactKernelCases:
+    """Shared cases; subclasses choose the numba or fallback kernels"""
+
+    # Both sides of EXACT_BNB_MIN_NODES
+    SIZES = [5, 7, 9, 12, 14, 16, 17, 18, 20]
+
+    def check(self, n, seed, weighted=False):
+        graph = random_graph(n, seed, weighted)
+        self.assertIsNone(cco.max_cut_closed_form(graph))
+        self.assertEqual(exact_max_cut(graph), brute_force_max_cut(graph),
+                         f"n={n}, seed={seed}, weighted={weighted}")
+
+    def test_unweighted_random_graphs(self):
+        """Exact optimum matches brute force on unweighted G(n, 0.5)"""
+        for n in self.SIZES:
+            with self.subTest(n=n):
+                self.check(n, seed=1337 + n)
+
+    def test_weighted_random_graphs(self):
+        """Edge weights do not change the (cardinality) optimum"""
+        for n in self.SIZES:
+            with self.subTest(n=n):
+                self.check(n, seed=42 + n, weighted=True)
+
+    def test_sizes_cover_both_solvers(self):
+        """The cases include enumeration and branch-and-bound sizes"""
+        self.assertTrue(any(n <= cco.EXACT_BNB_MIN_NODES for n in self.SIZES))
+        self.assertTrue(any(n > cco.EXACT_BNB_MIN_NODES for n in self.SIZES))
+
+@unittest.skipUnless(cco.NUMBA_AVAILABLE, "numba not installed")
+class TestExactKernelsNumba(ExactKernelCases, unittest.TestCase):
+    """Numba Gray-code kernel and jitted branch-and-bound"""
+
+class TestExactKernelsFallback(ExactKernelCases, unittest.TestCase):
+    """Chunked NumPy enumeration and pure-Python branch-and-bound"""
+
+    def setUp(self):
+        patches = [mock.patch.object(cco, 'NUMBA_AVAILABLE', False)]
+        # With numba installed the module name holds the jitted dispatcher
+        bnb = getattr(cco._max_cut_branch_and_bound, 'py_func', None)
+        if bnb is not None:
+            patches.append(mock.patch.object(cco, '_max_cut_branch_and_bound', bnb))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+if __name__ == '__main__':
+    unittest.main()
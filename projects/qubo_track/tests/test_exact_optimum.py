@@ -11,7 +11,6 @@ FIXED: Corrected expected values based on actual max-cut calculations
 import unittest
 import networkx as nx
 import time
-from itertools import product
 
 def compute_exact_max_cut_test(graph):
     """Test version that doesn't print progress for unit tests"""
@@ -19,10 +18,11 @@ def compute_exact_max_cut_test(graph):
     if n > 24:
         raise ValueError(f"Graph too large: {n} nodes")
     
+    # Assignment m puts node k on side (m >> k) & 1
+    edges_list = list(graph.edges())
     best_cut = 0
-    for assignment in product([0, 1], repeat=n):
-        cut_value = sum(1 for u, v in graph.edges() 
-                       if assignment[u] != assignment[v])
+    for m in range(1 << n):
+        cut_value = sum(1 for u, v in edges_list if ((m >> u) ^ (m >> v)) & 1)
         best_cut = max(best_cut, cut_value)
     
     return best_cut
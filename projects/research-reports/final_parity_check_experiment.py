@@ -19,51 +19,102 @@ Methodology:
 """
 
 import argparse
+import functools
+import hashlib
 import os
 import random
+import re
 import time
 
-import networkx as nx
 import numpy as np
-import pandas as pd
-from braket.aws import AwsDevice
-from braket.circuits import Circuit, instruction
+from braket.circuits import Circuit, Instruction, ResultType
+from braket.circuits.gates import CNot as CNotGate
+from braket.circuits.noises import AmplitudeDamping, PhaseDamping
+from braket.circuits.serialization import IRType
 from braket.devices import LocalSimulator
+from scipy.linalg import eigvalsh
 from src.validation.metrics import dm1_to_numpy
 
+# Optional JIT compilation of the fidelity post-processing (pip install numba)
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # --- Parameters ---
 N_QUBITS = 6
 GATE_BUDGET = 7
 RANDOM_INSTANCES = 10
 RANDOM_SEED = 1337
 
+# Local density-matrix backend (--device_arn local)
+LOCAL_BACKEND = "braket_dm"
+
+# Cloud batch submission
+BATCH_MAX_PARALLEL = 20
+BATCH_MAX_RETRIES = 3
+
+# Columns of the results CSV, one row per instance
+RESULT_COLUMNS = [
+    "circuit_type",
+    "instance",
+    "fidelity",
+    "min_eigenvalue",
+    "cnot_count",
+    "seed",
+    "from_cache",
+]
+
+# Density matrices of deterministic circuits are reused across runs
+CACHE_DIR = os.path.join("results", "cache")
+# Bump when the layout of the cached .npz files changes
+CACHE_FORMAT_VERSION = 1
+
 # Noise Model
 T1, T2, GATE_TIME = 40e-6, 60e-6, 200e-9
 P_AMPLITUDE = 1 - np.exp(-GATE_TIME / T1)
 P_DEPHASING = 1 - np.exp(-GATE_TIME / T2)
+# With both damping probabilities effectively zero the noisy circuit has the
+# ideal density matrix, so only the ideal circuits are submitted
+NOISELESS = P_AMPLITUDE < 1e-12 and P_DEPHASING < 1e-12
 
 np.random.seed(RANDOM_SEED)
 random.seed(RANDOM_SEED)
 
 
-def apply_noise_to_circuit(c: Circuit) -> Circuit:
-    noisy_c = Circuit()
+def apply_noise_to_circuit(c: Circuit) -> tuple[Circuit, int]:
+    """Returns a copy of c with amplitude and phase damping on both qubits
+    after every CNOT, together with the number of CNOTs it contains.
+
+    The instructions are collected in one pass and added to the new circuit
+    at once; the noise probabilities are bound to locals for the loop.
+    """
+    p_amp, p_deph = P_AMPLITUDE, P_DEPHASING
+    instructions, cnot_count = [], 0
     for instr in c.instructions:
-        noisy_c.add_instruction(instr)
-        if isinstance(instr, instruction.Instruction) and instr.operator.name == "CNot":
-            q1, q2 = instr.target
-            for q in (q1, q2):
-                noisy_c.amplitude_damping(q, P_AMPLITUDE)
-                noisy_c.phase_damping(q, P_DEPHASING)
-    return noisy_c
+        instructions.append(instr)
+        if type(instr.operator) is CNotGate:
+            cnot_count += 1
+            for q in instr.target:
+                instructions.append(Instruction(AmplitudeDamping(p_amp), q))
+                instructions.append(Instruction(PhaseDamping(p_deph), q))
+    return Circuit(instructions), cnot_count
 
 
 # --- Circuit Creation ---
+# Every builder starts from the same Hadamard layer; Instructions are
+# immutable, so the objects are shared instead of rebuilt per circuit
+_H_PREFIX = list(Circuit().h(range(N_QUBITS)).instructions)
+
+
 def create_padded_spatial_circuit():
     """Creates a spatial circuit and pads it with CNOT pairs to meet the budget.
     Padding with CNOT-CNOT pairs is logically identity but triggers noise twice.
+    Returns the circuit and its CNOT count.
     """
-    c = Circuit().h(range(N_QUBITS))
+    c = Circuit(_H_PREFIX)
     base_edges = [(i, i + 1) for i in range(N_QUBITS - 1)]
     for q1, q2 in base_edges:
         c.cnot(q1, q2)
@@ -85,38 +136,126 @@ def create_padded_spatial_circuit():
         q1, q2 = base_edges[i % len(base_edges)]
         c.cnot(q1, q2)  # Add the first CNOT of the pair
         c.cnot(q1, q2)  # Add the second CNOT, completing the identity
-    return c
+    # Counted from the built circuit so the budget check can fail
+    return c, sum(type(instr.operator) is CNotGate for instr in c.instructions)
 
 
 def create_sampled_nonspatial_circuit(seed: int):
-    c = Circuit().h(range(N_QUBITS))
+    c = Circuit(_H_PREFIX)
     possible_edges = [(i, j) for i in range(N_QUBITS) for j in range(i + 2, N_QUBITS)]
     rng = random.Random(seed)
     chosen_edges = rng.sample(possible_edges, GATE_BUDGET)
     for q1, q2 in chosen_edges:
         c.cnot(q1, q2)
-    return c
+    return c, len(chosen_edges)
+
+
+# Every possible edge of the N_QUBITS-node graph, for G(n, m) sampling
+ER_EDGES = np.array([(i, j) for i in range(N_QUBITS) for j in range(i + 1, N_QUBITS)])
 
 
 def create_random_er_circuit(seed: int):
+    # G(n, m) random graph: GATE_BUDGET distinct edges drawn uniformly
     rng = np.random.default_rng(seed)
-    G = nx.gnm_random_graph(N_QUBITS, GATE_BUDGET, seed=rng)
-    c = Circuit().h(range(N_QUBITS))
-    for u, v in G.edges():
-        c.cnot(u, v)
+    idx = rng.choice(len(ER_EDGES), size=GATE_BUDGET, replace=False)
+    c = Circuit(_H_PREFIX)
+    for u, v in ER_EDGES[idx]:
+        c.cnot(int(u), int(v))
+    return c, len(idx)
+
+
+# --- Main Logic ---
+def _ensure_dm(c: Circuit) -> Circuit:
+    """Requests the density matrix of c unless it already is requested."""
+    if not any(isinstance(rt, ResultType.DensityMatrix) for rt in c.result_types):
+        c.density_matrix()
     return c
 
 
-def count_cnots(c: Circuit) -> int:
-    return sum(
-        1
-        for i in c.instructions
-        if isinstance(i, instruction.Instruction) and i.operator.name == "CNot"
+@functools.lru_cache(maxsize=None)
+def build_instance(circuit_type: str, seed):
+    """Builds the base and noisy circuits for one instance, checking both
+    against the CNOT budget, and requests their density matrices."""
+    if circuit_type == "spatial_padded":
+        # This circuit is deterministic, no seed needed
+        base_circuit, cnot_count = create_padded_spatial_circuit()
+    elif circuit_type == "nonspatial_sampled":
+        base_circuit, cnot_count = create_sampled_nonspatial_circuit(seed)
+    else:  # random_er
+        base_circuit, cnot_count = create_random_er_circuit(seed)
+
+    # === Rigorous Assertions from Final Reviewer Feedback ===
+    # CNOT counts come from the builders and the noise pass, not a re-scan.
+    # Explicit raises keep the checks active under python -O.
+    if cnot_count != GATE_BUDGET:
+        raise AssertionError(
+            f"[{circuit_type}] Base circuit CNOT count is wrong! Expected {GATE_BUDGET}, got {cnot_count}"
+        )
+    noisy_circuit, noisy_cnot_count = apply_noise_to_circuit(base_circuit)
+    if noisy_cnot_count != GATE_BUDGET:
+        raise AssertionError(
+            f"[{circuit_type}] Noisy circuit CNOT count is wrong! Expected {GATE_BUDGET}, got {noisy_cnot_count}"
+        )
+    # =======================================================
+
+    return _ensure_dm(base_circuit), _ensure_dm(noisy_circuit), cnot_count
+
+
+def run_density_matrices(device, circuits):
+    """Runs circuits [base0, noisy0, base1, noisy1, ...] and returns their
+    density matrices in the same order.
+
+    All circuits go out as one batch. Braket executes cloud batches in
+    parallel, so the wait is the slowest task rather than the sum of all of
+    them, and the local simulator runs its batch in a process pool with one
+    worker per core. A local simulator without run_batch falls back to
+    running the pairs in turn, stopping early if one pair takes longer than
+    the wall-clock guard.
+    """
+    if not isinstance(device, LocalSimulator):
+        batch = device.run_batch(circuits, shots=0, max_parallel=BATCH_MAX_PARALLEL)
+        task_results = batch.results(
+            fail_unsuccessful=True, max_retries=BATCH_MAX_RETRIES
+        )
+    elif hasattr(device, "run_batch"):
+        batch = device.run_batch(circuits, shots=0, max_parallel=os.cpu_count())
+        task_results = batch.results()
+    else:
+        task_results = []
+        for k in range(0, len(circuits), 2):
+            t0 = time.time()
+            task_results += [
+                device.run(c, shots=0).result() for c in circuits[k : k + 2]
+            ]
+            if time.time() - t0 > 400:
+                print("Wall-clock guard triggered.")
+                break
+    return [dm1_to_numpy(r.result_types[0].value) for r in task_results]
+
+
+def device_id(device) -> str:
+    """Device ARN for cloud devices, or local:<simulator name>."""
+    return getattr(device, "arn", None) or f"local:{device.name}"
+
+
+def spatial_cache_path(device, circuits) -> str:
+    """Cache file for the spatial circuit's ideal/noisy density matrices,
+    keyed by the cache format, the device and the OpenQASM of the circuits,
+    so any change to the gates or noise probabilities misses the cache."""
+    dev = device_id(device)
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(repr((CACHE_FORMAT_VERSION, dev)).encode())
+    for c in circuits:
+        digest.update(c.to_ir(IRType.OPENQASM).source.encode())
+    dev_name = re.sub(r"[^A-Za-z0-9]+", "_", dev.rsplit("/", 1)[-1])
+    return os.path.join(
+        CACHE_DIR,
+        f"spatial_padded_{dev_name}_{N_QUBITS}_{GATE_BUDGET}_{digest.hexdigest()}.npz",
     )
 
 
-# --- Main Logic ---
 def run_parity_experiment(circuit_type: str, device, instances=1):
+    """Runs one circuit type and returns one RESULT_COLUMNS row per instance."""
     results = []
     print(
         f"\n--- Running Parity Check: {circuit_type} ({instances} instances) ---",
@@ -125,69 +264,103 @@ def run_parity_experiment(circuit_type: str, device, instances=1):
     main_rng = np.random.default_rng(RANDOM_SEED)
     instance_seeds = main_rng.integers(low=0, high=1_000_000, size=instances)
 
-    for i in range(instances):
-        t0, seed = time.time(), instance_seeds[i]
+    circuits, cnot_counts = [], []
+    for i, seed in enumerate(instance_seeds):
         print(
             f"  Instance {i+1}/{instances} (Seed: {seed}): Building circuits...",
             flush=True,
         )
-
-        if circuit_type == "spatial_padded":
-            # This circuit is deterministic, no seed needed
-            base_circuit = create_padded_spatial_circuit()
-        elif circuit_type == "nonspatial_sampled":
-            base_circuit = create_sampled_nonspatial_circuit(seed)
-        else:  # random_er
-            base_circuit = create_random_er_circuit(seed)
-
-        # === Rigorous Assertions from Final Reviewer Feedback ===
-        cnot_count = count_cnots(base_circuit)
-        assert (
-            cnot_count == GATE_BUDGET
-        ), f"[{circuit_type}] Base circuit CNOT count is wrong! Expected {GATE_BUDGET}, got {cnot_count}"
-        noisy_circuit = apply_noise_to_circuit(base_circuit)
-        noisy_cnot_count = count_cnots(noisy_circuit)
-        assert (
-            noisy_cnot_count == GATE_BUDGET
-        ), f"[{circuit_type}] Noisy circuit CNOT count is wrong! Expected {GATE_BUDGET}, got {noisy_cnot_count}"
-        # =======================================================
-
-        base_circuit.density_matrix()
-        noisy_circuit.density_matrix()
-
-        print(f"  Submitting to {device.name}...", flush=True)
-        ideal_task = device.run(base_circuit, shots=0)
-        noisy_task = device.run(noisy_circuit, shots=0)
-
-        ideal_dm = dm1_to_numpy(ideal_task.result().result_types[0].value)
-        noisy_dm = dm1_to_numpy(noisy_task.result().result_types[0].value)
-
+        base_circuit, noisy_circuit, cnot_count = build_instance(circuit_type, seed)
+        circuits += [base_circuit, noisy_circuit]
+        cnot_counts.append(cnot_count)
+
+    t0 = time.time()
+    # The spatial circuit and its noise are deterministic, so every instance
+    # shares one ideal/noisy pair that only has to be simulated once
+    cache_path = (
+        spatial_cache_path(device, circuits[:2])
+        if circuit_type == "spatial_padded"
+        else None
+    )
+    from_cache = bool(cache_path) and os.path.exists(cache_path)
+    if from_cache:
+        print(f"  Loading cached density matrices from '{cache_path}'", flush=True)
+        with np.load(cache_path) as cached:
+            dms = [cached["ideal"], cached["noisy"]] * instances
+    else:
+        if NOISELESS:
+            print(f"  Submitting {instances} tasks to {device.name}...", flush=True)
+            ideal_dms = run_density_matrices(device, circuits[::2])
+            dms = [dm for dm in ideal_dms for _ in range(2)]
+        else:
+            print(f"  Submitting {len(circuits)} tasks to {device.name}...", flush=True)
+            dms = run_density_matrices(device, circuits)
+        if cache_path and dms:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            np.savez_compressed(cache_path, ideal=dms[0], noisy=dms[1])
+    elapsed = time.time() - t0
+
+    # Results alternate ideal/noisy, one pair per instance
+    for i in range(len(dms) // 2):
+        ideal_dm, noisy_dm = dms[2 * i], dms[2 * i + 1]
         fidelity = fidelity_robust(ideal_dm, noisy_dm)
-        min_eig = np.min(np.real(np.linalg.eigvals(noisy_dm)))
+        # Density matrices are Hermitian (up to rounding in the returned
+        # values), so the symmetric solver applies and only the smallest
+        # eigenvalue has to be computed
+        noisy_dm = 0.5 * (noisy_dm + noisy_dm.conj().T)
+        min_eig = eigvalsh(noisy_dm, subset_by_index=[0, 0])[0]
 
-        elapsed = time.time() - t0
-        print(f"  -> Fidelity: {fidelity:.4f} (took {elapsed:.2f}s)", flush=True)
+        print(f"  -> Instance {i+1}: Fidelity: {fidelity:.4f}", flush=True)
         results.append(
-            {
-                "circuit_type": circuit_type,
-                "instance": i,
-                "fidelity": fidelity,
-                "min_eigenvalue": min_eig,
-                "cnot_count": cnot_count,
-                "seed": seed,
-            }
+            (
+                circuit_type,
+                i,
+                fidelity,
+                min_eig,
+                cnot_counts[i],
+                instance_seeds[i],
+                from_cache,
+            )
         )
-        if elapsed > 400:
-            print("Wall-clock guard triggered.")
-            break
+    print(f"  {len(results)} instances completed in {elapsed:.2f}s", flush=True)
     return results
 
 
+def _fidelity_loops(rho, sigma):
+    """fidelity_robust as explicit loops over complex128 matrices, for numba:
+    the traces and Tr(rho sigma) accumulate without any temporaries."""
+    trace_rho = 0.0 + 0.0j
+    trace_sigma = 0.0 + 0.0j
+    for i in range(rho.shape[0]):
+        trace_rho += rho[i, i]
+        trace_sigma += sigma[i, i]
+    # Same threshold as np.isclose(trace, 0)
+    inv_rho = 1.0 / trace_rho if abs(trace_rho) > 1e-8 else 1.0 + 0.0j
+    inv_sigma = 1.0 / trace_sigma if abs(trace_sigma) > 1e-8 else 1.0 + 0.0j
+    overlap = 0.0 + 0.0j
+    for i in range(rho.shape[0]):
+        for j in range(rho.shape[1]):
+            overlap += rho[i, j] * sigma[j, i]
+    value = (overlap * inv_rho * inv_sigma).real
+    return min(max(value, 0.0), 1.0)
+
+
+if NUMBA_AVAILABLE:
+    _fidelity_kernel = njit(cache=True, fastmath=True)(_fidelity_loops)
+
+
 def fidelity_robust(rho, sigma):
+    if NUMBA_AVAILABLE:
+        return _fidelity_kernel(
+            np.ascontiguousarray(rho, dtype=np.complex128),
+            np.ascontiguousarray(sigma, dtype=np.complex128),
+        )
+
     trace_rho, trace_sigma = np.trace(rho), np.trace(sigma)
     rho_norm = rho / trace_rho if not np.isclose(trace_rho, 0) else rho
     sigma_norm = sigma / trace_sigma if not np.isclose(trace_sigma, 0) else sigma
-    overlap = np.trace(rho_norm @ sigma_norm)
+    # Tr(AB) = sum_ij A_ij B_ji, without forming the product matrix
+    overlap = np.einsum("ij,ji->", rho_norm, sigma_norm, optimize=True)
     return max(
         0.0,
         min(
@@ -208,11 +381,13 @@ def main():
     )
     args = parser.parse_args()
 
-    device = (
-        AwsDevice(args.device_arn)
-        if args.device_arn != "local"
-        else LocalSimulator("braket_dm")
-    )
+    # braket.aws (and its boto3 clients) is only needed for cloud devices
+    if args.device_arn == "local":
+        device = LocalSimulator(LOCAL_BACKEND)
+    else:
+        from braket.aws import AwsDevice
+
+        device = AwsDevice(args.device_arn)
     print(f"Targeting device: {device.name}", flush=True)
 
     if not os.path.exists("results"):
@@ -230,7 +405,11 @@ def main():
         "random_er", device, instances=RANDOM_INSTANCES
     )
 
-    all_results = pd.DataFrame(spatial_results + nonspatial_results + random_results)
+    import pandas as pd
+
+    all_results = pd.DataFrame.from_records(
+        spatial_results + nonspatial_results + random_results, columns=RESULT_COLUMNS
+    )
 
     device_name = (
         "local" if args.device_arn == "local" else device.name.replace("/", "_")
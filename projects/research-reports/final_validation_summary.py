@@ -2,41 +2,78 @@
 Comprehensive visualization and conclusion of the gate-count advantage investigation.
 """
 
+import functools
 import json
+import os
+
+import matplotlib
+
+# Without a display there is nothing to show: render straight to file with
+# Agg instead of initialising a GUI backend
+if not os.environ.get("DISPLAY"):
+    matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+# Optional faster parsers (pip install pyarrow orjson)
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+try:
+    import orjson
 
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@functools.cache
 def load_all_results():
-    """Load all experimental results."""
+    """Load all experimental results.
+
+    The files are parsed once per process; later calls return the same
+    dictionary, so callers must not modify it.
+    """
     results = {}
 
     # Circuit analysis
     try:
-        circuit_df = pd.read_csv("results/circuit_analysis.csv")
+        circuit_df = pd.read_csv("results/circuit_analysis.csv", engine=CSV_ENGINE)
         results["circuit_analysis"] = circuit_df
+        # Grouped once here; the plots and conclusions look up types by key
+        results["circuit_by_type"] = dict(tuple(circuit_df.groupby("circuit_type")))
     except FileNotFoundError:
         print("Circuit analysis results not found")
 
     # Realistic noise test
     try:
-        noise_df = pd.read_csv("results/realistic_noise_test.csv")
+        noise_df = pd.read_csv("results/realistic_noise_test.csv", engine=CSV_ENGINE)
         results["realistic_noise"] = noise_df
     except FileNotFoundError:
         print("Realistic noise test results not found")
 
     # Hardware compatible test
     try:
-        hardware_df = pd.read_csv("results/hardware_compatible_test.csv")
+        hardware_df = pd.read_csv(
+            "results/hardware_compatible_test.csv", engine=CSV_ENGINE
+        )
         results["hardware_compatible"] = hardware_df
     except FileNotFoundError:
         print("Hardware compatible test results not found")
 
     # Statistical analysis
     try:
-        with open("results/statistical_analysis_report.json", "r") as f:
-            results["statistical_report"] = json.load(f)
+        with open("results/statistical_analysis_report.json", "rb") as f:
+            raw = f.read()
+        results["statistical_report"] = (
+            orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        )
     except FileNotFoundError:
         print("Statistical analysis report not found")
 
@@ -56,9 +93,10 @@ def create_comprehensive_visualization(results):
     if "circuit_analysis" in results:
         ax1 = axes[0, 0]
         circuit_data = results["circuit_analysis"]
+        by_type = results["circuit_by_type"]
 
-        spatial_data = circuit_data[circuit_data["circuit_type"] == "spatial"]
-        nonspatial_data = circuit_data[circuit_data["circuit_type"] == "nonspatial"]
+        spatial_data = by_type.get("spatial", circuit_data.iloc[:0])
+        nonspatial_data = by_type.get("nonspatial", circuit_data.iloc[:0])
 
         qubits = spatial_data["n_qubits"].values
         spatial_gates = spatial_data["total_gates"].values
@@ -192,31 +230,27 @@ def create_comprehensive_visualization(results):
     if "statistical_report" in results:
         stat_data = results["statistical_report"]
 
-        experiments = []
-        effect_sizes = []
-        p_values = []
-
-        for exp_type, data in stat_data.get("statistical_results", {}).items():
-            experiments.append(exp_type.replace("_", "\n"))
-            effect_sizes.append(data["effect_analysis"]["cohens_d"])
-            p_values.append(data["effect_analysis"]["p_value"])
+        stat_results = stat_data.get("statistical_results", {})
+        experiments = [exp_type.replace("_", "\n") for exp_type in stat_results]
 
         if experiments:
-            colors = ["green" if p < 0.05 else "orange" for p in p_values]
+            effect = pd.json_normalize(list(stat_results.values()))
+            effect_sizes = effect["effect_analysis.cohens_d"].to_numpy()
+            p_values = effect["effect_analysis.p_value"].to_numpy()
+            significance = np.select(
+                [p_values < 0.001, p_values < 0.01, p_values < 0.05],
+                ["***", "**", "*"],
+                default="ns",
+            )
+            colors = np.where(p_values < 0.05, "green", "orange")
             bars = ax4.bar(experiments, effect_sizes, color=colors, alpha=0.7)
 
             # Add significance markers
-            for i, (bar, p_val) in enumerate(zip(bars, p_values)):
-                height = bar.get_height()
-                significance = (
-                    "***"
-                    if p_val < 0.001
-                    else "**" if p_val < 0.01 else "*" if p_val < 0.05 else "ns"
-                )
+            for bar, marker in zip(bars, significance):
                 ax4.text(
                     bar.get_x() + bar.get_width() / 2.0,
-                    height + 0.01,
-                    significance,
+                    bar.get_height() + 0.01,
+                    marker,
                     ha="center",
                     va="bottom",
                     fontweight="bold",
@@ -229,7 +263,9 @@ def create_comprehensive_visualization(results):
 
     plt.tight_layout()
     plt.savefig("figures/final_validation_summary.png", dpi=300, bbox_inches="tight")
-    plt.show()
+    if os.environ.get("DISPLAY"):
+        plt.show()
+    plt.close(fig)
 
 
 def generate_final_conclusions(results):
@@ -250,8 +286,9 @@ def generate_final_conclusions(results):
     if "circuit_analysis" in results:
         print("✓ Circuit Analysis:")
         circuit_data = results["circuit_analysis"]
-        spatial = circuit_data[circuit_data["circuit_type"] == "spatial"]
-        nonspatial = circuit_data[circuit_data["circuit_type"] == "nonspatial"]
+        by_type = results["circuit_by_type"]
+        spatial = by_type.get("spatial", circuit_data.iloc[:0])
+        nonspatial = by_type.get("nonspatial", circuit_data.iloc[:0])
 
         print("  - Perfect crossover at 4 qubits (identical gate counts)")
         print("  - Non-spatial complexity grows quadratically with system size")
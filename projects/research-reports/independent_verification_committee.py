@@ -12,10 +12,18 @@ Committee Members:
 - Prof. Ahmed Hassan, Quantum Algorithms, ETH Zurich
 """
 
+import argparse
+import asyncio
+import dataclasses
+import functools
 import json
 import logging
+import math
+import os
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 from braket.aws import AwsDevice
@@ -23,29 +31,175 @@ from braket.circuits import Circuit
 from braket.devices import LocalSimulator
 from braket.tracking import Tracker
 
+# Optional streaming JSON parser for the original report (pip install ijson)
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional faster encoder for the verification report (pip install orjson)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# One timestamp per run, so the log and report filenames always match
+RUN_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
+
 # Configure independent logging
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - VERIFICATION - %(levelname)s - %(message)s",
     handlers=[
-        logging.FileHandler(
-            f'independent_verification_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-        ),
+        logging.FileHandler(f"independent_verification_{RUN_TIMESTAMP}.log"),
         logging.StreamHandler(),
     ],
 )
 logger = logging.getLogger(__name__)
 
+ORIGINAL_REPORT_PATH = "aws_quantum_study_report_20250628_234016.json"
+
+# Spend is tallied in integer micro-dollars; SV1 bills fractions of a cent
+MICROS_PER_USD = 1_000_000
+SV1_TASK_COST = 0.15  # Assumed price of one SV1 task when the tracker reports none
+MIN_SHOTS = 100
+
+# Report fields the claims are extracted from: single values, and arrays
+# whose items are needed
+_REPORT_VALUES = (
+    "study_metadata.total_spent",
+    "study_metadata.budget_efficiency",
+    "experimental_results.week1_entanglement.statistics.mean_fidelity",
+)
+_REPORT_ARRAYS = (
+    "experimental_results.week3_algorithms.measurements",
+    "experimental_results.week4_scaling.measurements",
+)
+
+
+def _stream_report(f) -> Dict[str, Any]:
+    """Streams only the claim fields out of the study report with ijson and
+    returns them in the report's own nesting; other branches are skipped
+    without being built."""
+    report = {}
+
+    def put(prefix: str, value):
+        *parents, leaf = prefix.split(".")
+        node = report
+        for key in parents:
+            node = node.setdefault(key, {})
+        return node.setdefault(leaf, value)
+
+    builder = items = item_prefix = None
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == item_prefix and event in ("end_map", "end_array"):
+                items.append(builder.value)
+                builder = None
+        elif prefix in _REPORT_VALUES:
+            put(prefix, value)
+        elif prefix.endswith(".item") and prefix[: -len(".item")] in _REPORT_ARRAYS:
+            items = put(prefix[: -len(".item")], [])
+            if event in ("start_map", "start_array"):
+                item_prefix, builder = prefix, ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                items.append(value)
+    return report
+
+
+@functools.lru_cache(maxsize=4)
+def _load_claims_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """Parsed study report, cached per (path, mtime) so it is re-read only
+    when the file changes. With ijson installed only the claim fields are
+    parsed. The returned dict is shared; do not modify it."""
+    if IJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            return _stream_report(f)
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _json_default(obj):
+    """Convert numpy scalars left in the report to Python types when dumping"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _shots_for_tolerance(tol: float, p_hat: float = 0.5, z: float = 1.96) -> int:
+    """Shots for a confidence half-width of tol (z standard errors, 95% by
+    default) on a proportion near p_hat"""
+    return max(MIN_SHOTS, math.ceil(z**2 * p_hat * (1 - p_hat) / tol**2))
+
+
+@dataclasses.dataclass
+class ScalingRecord:
+    """One qubit count of the scaling verification"""
+
+    qubits: int
+    verified_time: float
+    original_time: Optional[float]
+    time_ratio: Optional[float]
+    reasonable_agreement: bool
+
+
+@functools.lru_cache(maxsize=256)
+def create_independent_maxcut_circuit(gamma: float, beta: float) -> Circuit:
+    """Independently implemented QAOA MaxCut circuit, cached per (gamma, beta).
+    Device runs do not modify circuits; callers must not either."""
+    circuit = Circuit()
+
+    # Initial superposition
+    circuit.h(0)
+    circuit.h(1)
+    circuit.h(2)
+
+    # Problem Hamiltonian for triangle graph (0-1, 1-2, 0-2)
+    # Edge 0-1
+    circuit.cnot(0, 1)
+    circuit.rz(1, 2 * gamma)
+    circuit.cnot(0, 1)
+
+    # Edge 1-2
+    circuit.cnot(1, 2)
+    circuit.rz(2, 2 * gamma)
+    circuit.cnot(1, 2)
+
+    # Edge 0-2
+    circuit.cnot(0, 2)
+    circuit.rz(2, 2 * gamma)
+    circuit.cnot(0, 2)
+
+    # Mixer Hamiltonian
+    circuit.rx(0, 2 * beta)
+    circuit.rx(1, 2 * beta)
+    circuit.rx(2, 2 * beta)
+
+    circuit.probability()
+    return circuit
+
 
 class IndependentVerificationCommittee:
     """Independent committee to verify quantum research claims.
     Reproduces experiments without access to original implementation.
     """
 
-    def __init__(self):
-        self.verification_budget = 100.0  # Conservative verification budget
-        self.total_spent = 0.0
+    def __init__(self, cross_backend_verification: bool = False):
+        # SV1 is another noise-free statevector simulator, so repeating the
+        # local Bell run there only adds signal when explicitly requested
+        self.cross_backend_verification = cross_backend_verification
+        # Conservative verification budget of $100
+        self.verification_budget_micros = 100 * MICROS_PER_USD
+        self.total_spent_micros = 0
         self.verification_results = {}
+        # Protocols run on worker threads; guards the spend and verification_results
+        self._state_lock = threading.Lock()
         self.original_claims = self._load_original_claims()
 
         # Independent device setup
@@ -61,11 +215,30 @@ class IndependentVerificationCommittee:
             "Committee members: Vasquez (NIST), Kim (Toronto), Johnson (Google), Hassan (ETH)"
         )
 
+    @property
+    def verification_budget(self) -> float:
+        return self.verification_budget_micros / MICROS_PER_USD
+
+    @property
+    def total_spent(self) -> float:
+        return self.total_spent_micros / MICROS_PER_USD
+
+    def _can_spend(self, cost: float = SV1_TASK_COST) -> bool:
+        """Whether a task of the given cost (USD) still fits in the budget"""
+        return (
+            self.total_spent_micros + round(cost * MICROS_PER_USD)
+            <= self.verification_budget_micros
+        )
+
+    def _record_spend(self, cost: float):
+        with self._state_lock:
+            self.total_spent_micros += round(cost * MICROS_PER_USD)
+
     def _load_original_claims(self) -> Dict[str, Any]:
         """Load original study claims for verification"""
         try:
-            with open("aws_quantum_study_report_20250628_234016.json", "r") as f:
-                original_data = json.load(f)
+            path = os.path.abspath(ORIGINAL_REPORT_PATH)
+            original_data = _load_claims_cached(path, os.path.getmtime(path))
 
             # Extract key claims to verify
             claims = {
@@ -74,7 +247,8 @@ class IndependentVerificationCommittee:
                     "week1_entanglement"
                 ]["statistics"]["mean_fidelity"],
                 "qaoa_results": [],
-                "scaling_performance": [],
+                # Execution time by qubit count, for direct lookup
+                "scaling_performance": {},
                 "budget_efficiency": original_data["study_metadata"][
                     "budget_efficiency"
                 ],
@@ -96,36 +270,42 @@ class IndependentVerificationCommittee:
             if "week4_scaling" in original_data["experimental_results"]:
                 week4_data = original_data["experimental_results"]["week4_scaling"]
                 for measurement in week4_data["measurements"]:
-                    claims["scaling_performance"].append(
-                        {
-                            "qubits": measurement["qubits"],
-                            "execution_time": measurement["execution_time"],
-                        }
+                    # First measurement per qubit count wins, as in a scan
+                    claims["scaling_performance"].setdefault(
+                        measurement["qubits"], measurement["execution_time"]
                     )
 
-            logger.info(f"Loaded {len(claims)} categories of claims for verification")
+            logger.info("Loaded %d categories of claims for verification", len(claims))
             return claims
 
         except Exception as e:
-            logger.error(f"Could not load original claims: {e}")
+            logger.error("Could not load original claims: %s", e)
             return {}
 
-    def verify_bell_state_fidelity(self) -> Dict[str, Any]:
-        """Dr. Vasquez (NIST): Independent Bell state fidelity verification"""
-        logger.info("=== VERIFICATION 1: Bell State Fidelity (Dr. Vasquez, NIST) ===")
-
-        # Reconstruct Bell state circuit independently
+    @functools.cached_property
+    def bell_circuit(self) -> Circuit:
+        """Bell state circuit, reconstructed independently and shared by the protocols"""
         bell_circuit = Circuit()
         bell_circuit.h(0)
         bell_circuit.cnot(0, 1)
         bell_circuit.probability()
+        return bell_circuit
+
+    def verify_bell_state_fidelity(self) -> Dict[str, Any]:
+        """Dr. Vasquez (NIST): Independent Bell state fidelity verification"""
+        logger.info("=== VERIFICATION 1: Bell State Fidelity (Dr. Vasquez, NIST) ===")
 
+        bell_circuit = self.bell_circuit
         verification_results = []
+        # Resolve the 0.01 agreement tolerance around the claimed fidelity
+        shots = _shots_for_tolerance(
+            0.01, self.original_claims.get("bell_fidelity") or 0.5
+        )
 
         # Test on local simulator
         try:
             result = (
-                self.devices["local_simulator"].run(bell_circuit, shots=1000).result()
+                self.devices["local_simulator"].run(bell_circuit, shots=shots).result()
             )
             probs = result.measurement_probabilities
             measured_fidelity = probs.get("00", 0) + probs.get("11", 0)
@@ -134,27 +314,27 @@ class IndependentVerificationCommittee:
                 {
                     "device": "local_simulator",
                     "measured_fidelity": measured_fidelity,
-                    "probabilities": dict(probs),
-                    "shots": 1000,
+                    "probabilities": probs,
+                    "shots": shots,
                     "cost": 0.0,
                 }
             )
 
-            logger.info(f"Local simulator - Bell fidelity: {measured_fidelity:.3f}")
+            logger.info("Local simulator - Bell fidelity: %.3f", measured_fidelity)
 
         except Exception as e:
-            logger.error(f"Local verification failed: {e}")
+            logger.error("Local verification failed: %s", e)
 
-        # Test on cloud simulator if budget allows
-        if self.total_spent + 0.15 < self.verification_budget:
+        # Test on cloud simulator if requested and budget allows
+        if self.cross_backend_verification and self._can_spend():
             try:
                 with Tracker() as tracker:
-                    task = self.devices["sv1_simulator"].run(bell_circuit, shots=1000)
+                    task = self.devices["sv1_simulator"].run(bell_circuit, shots=shots)
                     result = task.result()
                     cost = (
                         float(tracker.qpu_tasks_cost())
                         if tracker.qpu_tasks_cost()
-                        else 0.15
+                        else SV1_TASK_COST
                     )
 
                     probs = result.measurement_probabilities
@@ -164,19 +344,21 @@ class IndependentVerificationCommittee:
                         {
                             "device": "sv1_simulator",
                             "measured_fidelity": measured_fidelity,
-                            "probabilities": dict(probs),
-                            "shots": 1000,
+                            "probabilities": probs,
+                            "shots": shots,
                             "cost": cost,
                         }
                     )
 
-                    self.total_spent += cost
+                    self._record_spend(cost)
                     logger.info(
-                        f"SV1 simulator - Bell fidelity: {measured_fidelity:.3f}, Cost: ${cost:.2f}"
+                        "SV1 simulator - Bell fidelity: %.3f, Cost: $%.2f",
+                        measured_fidelity,
+                        cost,
                     )
 
             except Exception as e:
-                logger.error(f"Cloud verification failed: {e}")
+                logger.error("Cloud verification failed: %s", e)
 
         # Compare with original claims
         original_fidelity = self.original_claims.get("bell_fidelity", 0)
@@ -195,85 +377,67 @@ class IndependentVerificationCommittee:
             ),
             "verifier": "Dr. Elena Vasquez, NIST",
         }
+        verification_summary["passed"] = bool(verification_summary["agreement"])
 
-        self.verification_results["bell_fidelity"] = verification_summary
+        with self._state_lock:
+            self.verification_results["bell_fidelity"] = verification_summary
         return verification_summary
 
     def verify_qaoa_algorithm(self) -> Dict[str, Any]:
         """Prof. Hassan (ETH Zurich): Independent QAOA algorithm verification"""
         logger.info("=== VERIFICATION 2: QAOA Algorithm (Prof. Hassan, ETH Zurich) ===")
 
-        def create_independent_maxcut_circuit(gamma: float, beta: float) -> Circuit:
-            """Independently implemented QAOA MaxCut circuit"""
-            circuit = Circuit()
-
-            # Initial superposition
-            circuit.h(0)
-            circuit.h(1)
-            circuit.h(2)
-
-            # Problem Hamiltonian for triangle graph (0-1, 1-2, 0-2)
-            # Edge 0-1
-            circuit.cnot(0, 1)
-            circuit.rz(1, 2 * gamma)
-            circuit.cnot(0, 1)
-
-            # Edge 1-2
-            circuit.cnot(1, 2)
-            circuit.rz(2, 2 * gamma)
-            circuit.cnot(1, 2)
-
-            # Edge 0-2
-            circuit.cnot(0, 2)
-            circuit.rz(2, 2 * gamma)
-            circuit.cnot(0, 2)
-
-            # Mixer Hamiltonian
-            circuit.rx(0, 2 * beta)
-            circuit.rx(1, 2 * beta)
-            circuit.rx(2, 2 * beta)
-
-            circuit.probability()
-            return circuit
-
-        # Independent cut value calculation
-        def calculate_cut_value(bitstring: str) -> int:
-            """Calculate MaxCut value for triangle graph"""
-            bits = [int(b) for b in bitstring]
-            cut_value = 0
-            # Edge (0,1)
-            if bits[0] != bits[1]:
-                cut_value += 1
-            # Edge (1,2)
-            if bits[1] != bits[2]:
-                cut_value += 1
-            # Edge (0,2)
-            if bits[0] != bits[2]:
-                cut_value += 1
-            return cut_value
-
         verification_results = []
         original_qaoa_claims = self.original_claims.get("qaoa_results", [])
 
-        for claim in original_qaoa_claims:
+        # Build every claim's circuit first and run them as one batch
+        circuits = [
+            create_independent_maxcut_circuit(
+                claim["parameters"]["gamma"], claim["parameters"]["beta"]
+            )
+            for claim in original_qaoa_claims
+        ]
+
+        # The triangle cut is 0 or 2, so its 0.1 tolerance is 0.05 on the
+        # probability of cutting. overall_agreement needs every claim to
+        # agree, so the tolerance is held at 3 standard errors, not 1.96
+        shots = _shots_for_tolerance(0.05, z=3.0)
+
+        try:
+            batch_results = (
+                self.devices["local_simulator"]
+                .run_batch(circuits, shots=shots)
+                .results()
+                if circuits
+                else []
+            )
+        except Exception as e:
+            logger.error("QAOA batch verification failed: %s", e)
+            batch_results = []
+
+        for claim, result in zip(original_qaoa_claims, batch_results):
             gamma = claim["parameters"]["gamma"]
             beta = claim["parameters"]["beta"]
             original_cut = claim["expected_cut"]
 
-            logger.info(f"Verifying QAOA with γ={gamma}, β={beta}")
-
-            circuit = create_independent_maxcut_circuit(gamma, beta)
+            logger.info("Verifying QAOA with γ=%s, β=%s", gamma, beta)
 
             try:
-                result = (
-                    self.devices["local_simulator"].run(circuit, shots=1000).result()
-                )
                 probs = result.measurement_probabilities
 
-                # Calculate expected cut value
-                expected_cut = sum(
-                    calculate_cut_value(state) * prob for state, prob in probs.items()
+                # Calculate expected cut value for the triangle graph: decode
+                # all bitstrings at once and count the differing endpoints of
+                # edges (0,1), (1,2) and (0,2)
+                p = np.fromiter(probs.values(), dtype=np.float64, count=len(probs))
+                bits = np.frombuffer(
+                    "".join(probs).encode("ascii"), dtype=np.uint8
+                ).reshape(len(probs), 3) - ord("0")
+                cut = (
+                    (bits[:, 0] ^ bits[:, 1])
+                    + (bits[:, 1] ^ bits[:, 2])
+                    + (bits[:, 0] ^ bits[:, 2])
                 )
+                expected_cut = float(cut @ p)
 
                 verification_result = {
                     "parameters": {"gamma": gamma, "beta": beta},
@@ -281,16 +445,22 @@ class IndependentVerificationCommittee:
                     "verified_cut": expected_cut,
                     "difference": abs(expected_cut - original_cut),
                     "agreement": abs(expected_cut - original_cut) < 0.1,
-                    "probabilities": dict(probs),
+                    "probabilities": probs,
                 }
 
                 verification_results.append(verification_result)
                 logger.info(
-                    f"γ={gamma}, β={beta}: Original={original_cut:.3f}, Verified={expected_cut:.3f}"
+                    "γ=%s, β=%s: Original=%.3f, Verified=%.3f",
+                    gamma,
+                    beta,
+                    original_cut,
+                    expected_cut,
                 )
 
             except Exception as e:
-                logger.error(f"QAOA verification failed for γ={gamma}, β={beta}: {e}")
+                logger.error(
+                    "QAOA verification failed for γ=%s, β=%s: %s", gamma, beta, e
+                )
 
         verification_summary = {
             "total_verified": len(verification_results),
@@ -299,22 +469,26 @@ class IndependentVerificationCommittee:
             "overall_agreement": all(r["agreement"] for r in verification_results),
             "verifier": "Prof. Ahmed Hassan, ETH Zurich",
         }
+        verification_summary["passed"] = verification_summary["overall_agreement"]
 
-        self.verification_results["qaoa_algorithm"] = verification_summary
+        with self._state_lock:
+            self.verification_results["qaoa_algorithm"] = verification_summary
         return verification_summary
 
     def verify_scaling_performance(self) -> Dict[str, Any]:
         """Prof. Kim (Toronto): Reproducible scaling analysis verification"""
         logger.info("=== VERIFICATION 3: Scaling Performance (Prof. Kim, Toronto) ===")
 
-        verification_results = []
-        original_scaling_claims = self.original_claims.get("scaling_performance", [])
+        records = []
+        original_scaling_claims = self.original_claims.get("scaling_performance", {})
 
         # Test same qubit counts as original study
         test_qubits = [2, 4, 6, 8, 10]
+        # Timings are filled in place, in order, for the trend analysis
+        times = np.empty(len(test_qubits), dtype=np.float64)
 
         for n_qubits in test_qubits:
-            logger.info(f"Verifying {n_qubits}-qubit scaling")
+            logger.info("Verifying %d-qubit scaling", n_qubits)
 
             # Create independent circuit
             circuit = Circuit()
@@ -322,68 +496,71 @@ class IndependentVerificationCommittee:
                 circuit.h(i)
             for i in range(n_qubits - 1):
                 circuit.cnot(i, i + 1)
-            circuit.probability()
+            # No probability() result type: shot sampling alone is timed, without
+            # building the dense 2**n vector the analysis never reads
 
             try:
-                start_time = datetime.now()
-                result = (
-                    self.devices["local_simulator"].run(circuit, shots=1000).result()
-                )
-                execution_time = (datetime.now() - start_time).total_seconds()
+                t0 = time.perf_counter_ns()
+                self.devices["local_simulator"].run(circuit, shots=1000).result()
+                execution_time = (time.perf_counter_ns() - t0) * 1e-9
 
                 # Find original claim for this qubit count
-                original_time = None
-                for claim in original_scaling_claims:
-                    if claim["qubits"] == n_qubits:
-                        original_time = claim["execution_time"]
-                        break
-
-                verification_result = {
-                    "qubits": n_qubits,
-                    "verified_time": execution_time,
-                    "original_time": original_time,
-                    "time_ratio": (
-                        execution_time / original_time if original_time else None
-                    ),
-                    "reasonable_agreement": (
-                        abs(execution_time - (original_time or 0)) < 0.1
-                        if original_time
-                        else True
-                    ),
-                }
-
-                verification_results.append(verification_result)
-                logger.info(
-                    f"{n_qubits} qubits: {execution_time:.3f}s (Original: {original_time:.3f}s)"
-                    if original_time
-                    else f"{n_qubits} qubits: {execution_time:.3f}s"
+                original_time = original_scaling_claims.get(n_qubits)
+
+                times[len(records)] = execution_time
+                records.append(
+                    ScalingRecord(
+                        qubits=n_qubits,
+                        verified_time=execution_time,
+                        original_time=original_time,
+                        time_ratio=(
+                            execution_time / original_time if original_time else None
+                        ),
+                        reasonable_agreement=(
+                            abs(execution_time - (original_time or 0)) < 0.1
+                            if original_time
+                            else True
+                        ),
+                    )
                 )
+                if original_time:
+                    logger.info(
+                        "%d qubits: %.3fs (Original: %.3fs)",
+                        n_qubits,
+                        execution_time,
+                        original_time,
+                    )
+                else:
+                    logger.info("%d qubits: %.3fs", n_qubits, execution_time)
 
             except Exception as e:
-                logger.error(f"Scaling verification failed for {n_qubits} qubits: {e}")
+                logger.error(
+                    "Scaling verification failed for %d qubits: %s", n_qubits, e
+                )
 
         # Analyze scaling trend
-        times = [r["verified_time"] for r in verification_results]
-        qubits = [r["qubits"] for r in verification_results]
+        times = times[: len(records)]
+        qubits = [r.qubits for r in records]
 
         # Check for exponential scaling
-        if len(times) >= 3:
-            time_ratios = [times[i + 1] / times[i] for i in range(len(times) - 1)]
-            exponential_trend = (
-                np.mean(time_ratios) > 1.5
+        if len(records) >= 3:
+            time_ratios = times[1:] / times[:-1]
+            exponential_trend = bool(
+                time_ratios.mean() > 1.5
             )  # Growing by at least 50% per step
         else:
             exponential_trend = False
 
         verification_summary = {
-            "verification_results": verification_results,
+            "verification_results": [dataclasses.asdict(r) for r in records],
             "exponential_scaling_confirmed": exponential_trend,
-            "mean_execution_times": dict(zip(qubits, times)),
+            "mean_execution_times": dict(zip(qubits, times.tolist())),
             "scaling_trend": "exponential" if exponential_trend else "sub-exponential",
             "verifier": "Prof. David Kim, University of Toronto",
         }
 
-        self.verification_results["scaling_performance"] = verification_summary
+        with self._state_lock:
+            self.verification_results["scaling_performance"] = verification_summary
         return verification_summary
 
     def verify_cost_claims(self) -> Dict[str, Any]:
@@ -395,44 +572,56 @@ class IndependentVerificationCommittee:
         original_cost = self.original_claims.get("total_cost", 0)
         verification_cost = self.total_spent
 
-        # Test cost estimation accuracy
-        test_circuit = Circuit()
-        test_circuit.h(0)
-        test_circuit.cnot(0, 1)
-        test_circuit.probability()
-
         cost_verification_results = []
 
-        if self.total_spent + 0.15 < self.verification_budget:
+        # Reuse the SV1 Bell task when one was run rather than paying for another
+        bell_results = self.verification_results.get("bell_fidelity", {})
+        sv1_run = next(
+            (
+                r
+                for r in bell_results.get("verification_results", [])
+                if r["device"] == "sv1_simulator"
+            ),
+            None,
+        )
+
+        measured_cost = None
+        if sv1_run is not None:
+            shots, measured_cost = sv1_run["shots"], sv1_run["cost"]
+        elif self._can_spend():
+            shots = 100
             try:
                 with Tracker() as tracker:
-                    task = self.devices["sv1_simulator"].run(test_circuit, shots=100)
-                    result = task.result()
+                    task = self.devices["sv1_simulator"].run(
+                        self.bell_circuit, shots=shots
+                    )
+                    task.result()
                     measured_cost = (
                         float(tracker.qpu_tasks_cost())
                         if tracker.qpu_tasks_cost()
-                        else 0.15
-                    )
-
-                    cost_verification_results.append(
-                        {
-                            "task_type": "SV1_simulator_100_shots",
-                            "measured_cost": measured_cost,
-                            "expected_cost_range": [
-                                0.075,
-                                0.225,
-                            ],  # $0.075 base + variation
-                            "within_expected_range": 0.075 <= measured_cost <= 0.225,
-                        }
+                        else SV1_TASK_COST
                     )
 
-                    self.total_spent += measured_cost
-                    logger.info(
-                        f"Cost verification: ${measured_cost:.2f} for 100-shot task"
-                    )
+                    self._record_spend(measured_cost)
 
             except Exception as e:
-                logger.error(f"Cost verification failed: {e}")
+                logger.error("Cost verification failed: %s", e)
+
+        if measured_cost is not None:
+            cost_verification_results.append(
+                {
+                    "task_type": f"SV1_simulator_{shots}_shots",
+                    "measured_cost": measured_cost,
+                    "expected_cost_range": [
+                        0.075,
+                        0.225,
+                    ],  # $0.075 base + variation
+                    "within_expected_range": 0.075 <= measured_cost <= 0.225,
+                }
+            )
+            logger.info(
+                "Cost verification: $%.2f for %d-shot task", measured_cost, shots
+            )
 
         verification_summary = {
             "original_total_cost": original_cost,
@@ -443,31 +632,25 @@ class IndependentVerificationCommittee:
             "budget_efficiency_confirmed": self.total_spent < self.verification_budget,
             "verifier": "Dr. Sarah Johnson, Google Research",
         }
+        verification_summary["passed"] = verification_summary["cost_agreement"]
 
-        self.verification_results["cost_analysis"] = verification_summary
+        with self._state_lock:
+            self.verification_results["cost_analysis"] = verification_summary
         return verification_summary
 
     def generate_verification_report(self) -> Dict[str, Any]:
         """Generate independent verification committee report"""
         logger.info("=== GENERATING INDEPENDENT VERIFICATION REPORT ===")
 
-        # Count agreements and disagreements
-        agreements = 0
-        total_verifications = 0
-
-        for category, results in self.verification_results.items():
-            if "agreement" in results:
-                total_verifications += 1
-                if results["agreement"]:
-                    agreements += 1
-            elif "overall_agreement" in results:
-                total_verifications += 1
-                if results["overall_agreement"]:
-                    agreements += 1
-            elif "cost_agreement" in results:
-                total_verifications += 1
-                if results["cost_agreement"]:
-                    agreements += 1
+        # Count agreements and disagreements; protocols that test a claim
+        # record their verdict as "passed" (the scaling analysis does not)
+        verdicts = [
+            results["passed"]
+            for results in self.verification_results.values()
+            if "passed" in results
+        ]
+        total_verifications = len(verdicts)
+        agreements = sum(verdicts)
 
         # Committee consensus
         consensus_threshold = 0.75  # 75% agreement required
@@ -505,30 +688,30 @@ class IndependentVerificationCommittee:
             ),
         }
 
-        # Save verification report (convert numpy types to Python types)
-        def convert_numpy_types(obj):
-            if isinstance(obj, np.bool_):
-                return bool(obj)
-            elif isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                return float(obj)
-            elif isinstance(obj, dict):
-                return {k: convert_numpy_types(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_numpy_types(v) for v in obj]
-            return obj
-
-        report = convert_numpy_types(report)
-
-        report_filename = f'independent_verification_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-        with open(report_filename, "w") as f:
-            json.dump(report, f, indent=2)
-
-        logger.info(f"Independent verification report saved: {report_filename}")
-        logger.info(f"Verification passed: {verification_passed}")
+        report_filename = f"independent_verification_report_{RUN_TIMESTAMP}.json"
+        if ORJSON_AVAILABLE:
+            with open(report_filename, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        report,
+                        default=_json_default,
+                        option=orjson.OPT_INDENT_2
+                        | orjson.OPT_SERIALIZE_NUMPY
+                        | orjson.OPT_NON_STR_KEYS,
+                    )
+                )
+        else:
+            with open(report_filename, "w") as f:
+                # numpy scalars are converted by the encoder as it meets them
+                json.dump(report, f, indent=2, default=_json_default)
+
+        logger.info("Independent verification report saved: %s", report_filename)
+        logger.info("Verification passed: %s", verification_passed)
         logger.info(
-            f"Agreement rate: {agreements}/{total_verifications} ({100*agreements/total_verifications:.1f}%)"
+            "Agreement rate: %d/%d (%.1f%%)",
+            agreements,
+            total_verifications,
+            100 * agreements / total_verifications,
         )
 
         return report
@@ -580,7 +763,20 @@ class IndependentVerificationCommittee:
 
         return recommendations
 
-    def execute_independent_verification(self) -> Dict[str, Any]:
+    async def _run_verification_protocols(self):
+        """Run the verification protocols one at a time off the event loop"""
+        # The QAOA batch forks a local simulator pool, which can deadlock if
+        # another thread holds a lock at fork time, so it runs on its own
+        await asyncio.to_thread(self.verify_qaoa_algorithm)
+        # Both submit SV1 tasks under a Tracker, and the cost analysis
+        # reports the spend including the Bell run, so they stay ordered
+        await asyncio.to_thread(self.verify_bell_state_fidelity)
+        await asyncio.to_thread(self.verify_cost_claims)
+        # The scaling timings run last and alone, so no other protocol's
+        # thread competes with them for the CPU
+        await asyncio.to_thread(self.verify_scaling_performance)
+
+    async def execute_independent_verification(self) -> Dict[str, Any]:
         """Execute complete independent verification protocol"""
         logger.info("Starting Independent Verification Committee Review")
         logger.info(
@@ -589,10 +785,7 @@ class IndependentVerificationCommittee:
 
         try:
             # Execute all verification protocols
-            self.verify_bell_state_fidelity()
-            self.verify_qaoa_algorithm()
-            self.verify_scaling_performance()
-            self.verify_cost_claims()
+            await self._run_verification_protocols()
 
             # Generate final verification report
             final_report = self.generate_verification_report()
@@ -601,20 +794,32 @@ class IndependentVerificationCommittee:
             return final_report
 
         except Exception as e:
-            logger.error(f"Verification execution failed: {e}")
+            logger.error("Verification execution failed: %s", e)
             return self.generate_verification_report()  # Generate partial report
 
 
 def main():
     """Execute independent verification"""
+    parser = argparse.ArgumentParser(
+        description="Run the Independent Verification Committee review."
+    )
+    parser.add_argument(
+        "--cross_backend",
+        action="store_true",
+        help="Repeat the Bell state verification on the SV1 cloud simulator.",
+    )
+    args = parser.parse_args()
+
     print("Independent Verification Committee")
     print("=" * 50)
     print("Third-party validation of AWS Quantum Research findings")
     print("Committee: Vasquez (NIST), Kim (Toronto), Johnson (Google), Hassan (ETH)")
     print("=" * 50)
 
-    committee = IndependentVerificationCommittee()
-    verification_report = committee.execute_independent_verification()
+    committee = IndependentVerificationCommittee(
+        cross_backend_verification=args.cross_backend
+    )
+    verification_report = asyncio.run(committee.execute_independent_verification())
 
     print("\n" + "=" * 50)
     print("INDEPENDENT VERIFICATION COMPLETED")